@@ -1,51 +1,61 @@
-import yaml
+import sys
+import tomllib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
 
 import logging
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
 class Config:
     """
-    Config class loads configuration from config.yaml and manages application settings.
+    Config class loads configuration from config.toml and manages application settings.
 
-    This class reads the YAML configuration file, validates the settings, and provides
-    access to simulation parameters such as logging level, simulation area, and robot
-    starting position.
+    This class reads the TOML configuration file, validates the settings, and provides
+    access to simulation parameters such as logging level and simulation area. Instances
+    are immutable; use get_config() to obtain the shared instance for the process.
 
     Attributes:
-        config_file (str): Path to the configuration file. Defaults to 'config.yaml'.
+        config_file (str): Path to the configuration file. Defaults to 'config.toml'.
         logging_level (int): The logging level for the application.
         simulation_area (tuple[int, int]): The dimensions of the simulation area as (width, height).
     """
-    config_file = 'config.yaml'
-    logging_level = logging.INFO
+    config_file: ClassVar[str] = 'config.toml'
+    logging_level: int = logging.INFO
     simulation_area: tuple[int, int] = None
 
     @classmethod
-    def check_config(cls, simulation_area: tuple[int, int]) -> None:
+    def check_config(cls, simulation_area: tuple[int, int]) -> list[str]:
         """
         Validate the configuration parameters.
 
-        Ensures that simulation_area and start_position are properly set and have
-        the correct types.
+        Ensures that simulation_area is properly set and has the correct types.
 
         Args:
             simulation_area (tuple[int, int]): The total area that the robot can move within.
 
-        Raises:
-            Exception: If simulation_area is None or not a tuple.
-            Exception: If start_position is None or not a tuple.
+        Returns:
+            list[str]: A message for each validation failure. Empty if the config is valid.
         """
-        logging.debug(f'Checking config. simulation_area: {simulation_area} type: {type(simulation_area)}')
+        logging.debug('Checking config. simulation_area: %s type: %s', simulation_area, type(simulation_area))
 
         if simulation_area is None:
-            raise Exception("Invalid config. Simulation area is not set.")
+            return ['Invalid config. Simulation area is not set.']
         if not isinstance(simulation_area, tuple):
-            raise Exception("Invalid config. Simulation area is not of type tuple[int, int]")
-        logging.debug('Config is valid.')
-        return None
-
-    @classmethod
-    def set_logging_level(cls, level: str) -> None:
+            return ['Invalid config. Simulation area is not of type tuple[int, int]']
+
+        errors = []
+        for axis, value in zip(('x', 'y'), simulation_area):
+            # bool is a subclass of int, so reject it explicitly (e.g. x = true would otherwise be a width of 1).
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                errors.append(f'Invalid config. Simulation area {axis} must be a positive integer. Received: {value}')
+        if not errors:
+            logging.debug('Config is valid.')
+        return errors
+
+    @staticmethod
+    def set_logging_level(level: str) -> int:
         """
         Set the logging level for the application based on the configuration.
 
@@ -55,57 +65,73 @@ class Config:
         Args:
             level (str): The logging level as a string ('DEBUG', 'INFO', 'WARNING', 'ERROR').
                         Defaults to 'INFO' if an unrecognized value is provided.
+
+        Returns:
+            int: The logging constant that was applied.
         """
         match level:
             case 'DEBUG':
-                cls.logging_level = logging.DEBUG
+                logging_level = logging.DEBUG
             case 'INFO':
-                cls.logging_level = logging.INFO
+                logging_level = logging.INFO
             case 'WARNING':
-                cls.logging_level = logging.WARNING
+                logging_level = logging.WARNING
             case 'ERROR':
-                cls.logging_level = logging.ERROR
+                logging_level = logging.ERROR
             case _:
-                cls.logging_level = logging.INFO
-        logging.getLogger().setLevel(level=cls.logging_level)
+                logging_level = logging.INFO
+        logging.getLogger().setLevel(level=logging_level)
+        return logging_level
 
-    def __init__(self) -> None:
+    @classmethod
+    def load(cls) -> 'Config':
         """
-        Initialise the Config by loading and parsing the YAML configuration file.
+        Create a Config by loading and parsing the TOML configuration file.
 
-        Reads config.yaml, extracts simulation_area and start_position, validates
+        Reads config.toml, extracts simulation_area, validates
         the configuration, and sets the logging level.
 
-        Raises:
-            Exception: If configuration validation fails.
-            yaml.YAMLError: If there's an error whilst parsing the YAML file.
+        Returns:
+            Config: The loaded configuration.
 
         Note:
             The application will exit with code 1 if configuration loading or validation fails.
         """
-        with open(self.config_file) as stream:
-            try:
-                logging.info('Loading config from YAML file. ')
-                config = yaml.safe_load(stream)
-
-                self.set_logging_level(config['logging_level'])
-
-                simulation_area_config = config['simulation_area']
-
-                simulation_area = (
-                    simulation_area_config['x'],
-                    simulation_area_config['y']
-                )
-                try:
-                    self.check_config(simulation_area)
-                except Exception as e:
-                    logger.error('Failed to load config. Exiting...')
-                    logger.error(e)
-                    exit(1)
-
-                self.simulation_area = simulation_area
-                logging.debug(f'Config set to logging level: {self.logging_level}, simulation_area: {self.simulation_area}')
-            except yaml.YAMLError as yaml_e:
-                logger.error('Error whilst loading config file. Exiting...')
-                logger.error(yaml_e)
-                exit(1)
+        try:
+            logging.info('Loading config from TOML file. ')
+            with open(cls.config_file, 'rb') as stream:
+                config = tomllib.load(stream)
+
+            logging_level = cls.set_logging_level(config['logging_level'])
+
+            simulation_area_config = config['simulation_area']
+
+            simulation_area = (
+                simulation_area_config['x'],
+                simulation_area_config['y']
+            )
+            errors = cls.check_config(simulation_area)
+            if errors:
+                logger.error('Failed to load config. Exiting...')
+                logger.error('\n'.join(errors))
+                sys.exit(1)
+
+            logging.debug('Config set to logging level: %s, simulation_area: %s', logging_level, simulation_area)
+            return cls(logging_level=logging_level, simulation_area=simulation_area)
+        except tomllib.TOMLDecodeError as toml_e:
+            logger.error('Error whilst loading config file. Exiting...')
+            logger.error(toml_e)
+            sys.exit(1)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the application Config, loading it on first use.
+
+    The config is loaded at most once per process; subsequent calls return the same instance.
+
+    Returns:
+        Config: The shared application config.
+    """
+    return Config.load()
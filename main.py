@@ -1,65 +1,67 @@
 import argparse
 import logging
+import re
+import sys
+from collections.abc import Callable
+from functools import partial
 
-from config.config import Config
+from config.config import get_config
 from managers.location_manager import LocationManager
 from managers.robot_manager import RobotManager
 from managers.simulation_area_manager import SimulationAreaManager
 
-if __name__ == '__main__':
-    # Set the initial logging level to the default of INFO
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    logger = logging.getLogger(__name__)
-
-
-
-    # Allows the logging level to be set via command line argument. to enable early debugging before config is loaded.
-    parser = argparse.ArgumentParser(description='Toy robot simulator.')
-    parser.add_argument('--log-level', help='Set logging level. Default is INFO (overrides config.yaml).', default='INFO')
-    args = parser.parse_args()
-    if args.log_level is not None:
-        level = getattr(logging, args.log_level.upper())
-        logging.getLogger().setLevel(level=level)
-
-    logger.info('Starting simulation...')
-
-
-    # Load config from the YAML file.
-    config = Config()
-    logger.info(f'Logging level set to: {config.logging_level}')
-
-    # Load simulation area from config, this is the total area that the robot can move within.
-    simulation_manager = SimulationAreaManager(config.simulation_area)
-    logger.info(f'Simulation area set to: {simulation_manager.get_simulation_area()}')
-
-
-    # Load the start position from config, this is the position the robot starts at.
-    location_manager = LocationManager(simulation_manager.get_simulation_area())
-
-    # Initialise RobotManager.
-    robot_manager = RobotManager(location_manager)
-
-    # List of available commands for application to use, presented to user on start up or when HELP command is given.
-    available_commands = 'Available commands: PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | STOP | HELP'
-
-    # Start of user input monitoring. Listening for commands.
-    print('Toy Robot Simulation')
-    print(available_commands)
-    print("-" * 70)
-
+logger = logging.getLogger(__name__)
+
+# Matches PLACE X,Y,F. Direction names are validated by LocationManager.
+_PLACE_RE = re.compile(r'^PLACE\s+(-?\d+),(-?\d+),([A-Z]+)$')
+
+
+def run_command_loop(robot_manager: RobotManager, available_commands: str) -> None:
+    """
+    Read and process user commands until the STOP command is given or input ends.
+
+    Args:
+        robot_manager (RobotManager): The robot manager to send commands to.
+        available_commands (str): The help text listing the available commands.
+    """
+    # Handlers for the commands that take no arguments. PLACE, STOP and HELP are handled in the command loop.
+    commands: dict[str, Callable[[], str]] = {
+        'REPORT': robot_manager.report_robot_location,
+        'LEFT': partial(robot_manager.turn_robot, 'LEFT'),
+        'RIGHT': partial(robot_manager.turn_robot, 'RIGHT'),
+        'MOVE': robot_manager.move_robot,
+    }
+
+    # Bind frequently used callables to locals so the loop avoids repeated global and attribute lookups.
+    if sys.stdin.isatty():
+        _read_line = partial(input, '> ')
+    else:
+        # Scripted input (e.g. piped from a file) is read line by line without prompting.
+        _read_line = partial(next, iter(sys.stdin))
+    _intern = sys.intern
+    _get_handler = commands.get
+    _report = robot_manager.report_robot_location
+    _place = robot_manager.place_robot
+    _place_match = _PLACE_RE.match
 
     # Command loop. Runs application until the STOP command is given or KeyboardInterrupt is received.
     running = True
     while running:
         try:
-            command = input("> ").strip().upper()
+            # Interned so handler lookups can match the (already interned) command keys by identity.
+            command = _intern(_read_line().strip().upper())
             if not command:
                 continue
 
-            if command == 'STOP':
+            handler = _get_handler(command)
+            if handler is not None:
+                logger.debug('Processing %s command...', command)
+                print(f'Processing {command} command...')
+                print(handler())
+            elif command == 'STOP':
                 running = False
                 logger.info('Exiting simulation...')
-                print(f'Robots final location: {robot_manager.report_robot_location()}')
+                print(f'Robots final location: {_report()}')
                 print('Exiting simulation...')
                 break
             elif command.startswith('PLACE'):
@@ -68,42 +70,22 @@ if __name__ == '__main__':
                 logger.debug('Processing PLACE command...')
                 print('Processing PLACE command...')
                 try:
-                    parts = command.split()
-                    if len(parts) != 2:
+                    place_match = _place_match(command)
+                    if place_match is None:
                         raise Exception('Invalid PLACE command. Please provide X,Y,F coordinates separated by commas.')
-                    coords = parts[1].split(',')
-                    if len(coords) != 3:
-                        raise Exception('Invalid PLACE command. Please provide X,Y,F coordinates separated by commas.')
-                    x, y, direction = coords
-                    print(robot_manager.place_robot((int(x), int(y), direction)))
+                    print(_place((int(place_match[1]), int(place_match[2]), place_match[3])))
                 except Exception as e:
                     logger.error(f'Error whilst processing PLACE command: {e}')
                     print(e)
                     continue
-            elif command == 'REPORT':
-                logger.debug('Processing REPORT command...')
-                print('Processing REPORT command...')
-                print(robot_manager.report_robot_location())
-            elif command == 'LEFT':
-                logger.debug('Processing LEFT command...')
-                print('Processing LEFT command...')
-                print(robot_manager.turn_robot('LEFT'))
-            elif command == 'RIGHT':
-                logger.debug('Processing RIGHT command...')
-                print('Processing RIGHT command...')
-                print(robot_manager.turn_robot('RIGHT'))
-            elif command == 'MOVE':
-                logger.debug('Processing MOVE command...')
-                print('Processing MOVE command...')
-                print(robot_manager.move_robot())
             elif command == 'HELP':
                 logger.debug('Processing HELP command...')
                 print(available_commands)
             else:
                 logger.warning(f'Unknown command: {command}')
                 print(f'Unknown command: {command}. {available_commands}')
-        except EOFError:
-            # Handles EOFError when user presses Ctrl+D (Unix) or Ctrl+Z (windows).
+        except (EOFError, StopIteration):
+            # Handles EOFError when user presses Ctrl+D (Unix) or Ctrl+Z (windows), or the end of scripted input.
             running = False
             logger.info('Exiting simulation...')
         except KeyboardInterrupt:
@@ -116,5 +98,49 @@ if __name__ == '__main__':
             logger.error(f'Error whilst processing. Exiting simulation...')
             logger.error(e)
             exit(1)
+
+
+if __name__ == '__main__':
+    # Set the initial logging level to the default of INFO
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+
+    # Allows the logging level to be set via command line argument. to enable early debugging before config is loaded.
+    parser = argparse.ArgumentParser(description='Toy robot simulator.')
+    parser.add_argument('--log-level', help='Set logging level. Default is INFO (overrides config.toml).', default='INFO')
+    args = parser.parse_args()
+    if args.log_level is not None:
+        level = getattr(logging, args.log_level.upper())
+        logging.getLogger().setLevel(level=level)
+
+    logger.info('Starting simulation...')
+
+
+    # Load config from the TOML file.
+    config = get_config()
+    logger.info(f'Logging level set to: {config.logging_level}')
+
+    # Load simulation area from config, this is the total area that the robot can move within.
+    simulation_manager = SimulationAreaManager(width=config.simulation_area[0], height=config.simulation_area[1])
+    simulation_area = simulation_manager.get_simulation_area()
+    logger.info(f'Simulation area set to: {simulation_area}')
+
+
+    # Initialise LocationManager with the simulation area, the robot is not placed until a PLACE command is given.
+    location_manager = LocationManager(simulation_area)
+
+    # Initialise RobotManager.
+    robot_manager = RobotManager(location_manager)
+
+    # List of available commands for application to use, presented to user on start up or when HELP command is given.
+    available_commands = 'Available commands: PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | STOP | HELP'
+
+    # Start of user input monitoring. Listening for commands.
+    print('Toy Robot Simulation')
+    print(available_commands)
+    print("-" * 70)
+
+    run_command_loop(robot_manager, available_commands)
     print('Simulation complete.')
     logger.info('Simulation complete.')
@@ -15,10 +15,20 @@ class LocationManager:
         location_x (int): The current x-coordinate of the robot.
         location_y (int): The current y-coordinate of the robot.
         location_facing (str): The direction the robot is facing (NORTH, EAST, SOUTH, WEST).
-        available_directions (list[str]): Valid directions for robot orientation.
     """
 
-    available_directions = ['NORTH', 'EAST', 'SOUTH', 'WEST']
+    __slots__ = ('simulation_area', 'location_x', 'location_y', 'location_facing')
+
+    # Valid directions for robot orientation, in clockwise order for messages.
+    _DIRECTIONS = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+    _VALID_DIRECTIONS = frozenset(_DIRECTIONS)
+
+    # Direction lookups for a 90 degree turn, so rotating is a single dict lookup.
+    _RIGHT = {'NORTH': 'EAST', 'EAST': 'SOUTH', 'SOUTH': 'WEST', 'WEST': 'NORTH'}
+    _LEFT = {v: k for k, v in _RIGHT.items()}
+
+    # Unit (dx, dy) vector for a single move in each direction.
+    _DELTAS = {'NORTH': (0, 1), 'EAST': (1, 0), 'SOUTH': (0, -1), 'WEST': (-1, 0)}
 
     def __init__(self, simulation_area: tuple[int, int]) -> None:
         """
@@ -32,12 +42,13 @@ class LocationManager:
         self.location_y = None
         self.location_facing = None
 
-    @classmethod
-    def check_location(cls, simulation_area, location: tuple) -> bool:
+    @staticmethod
+    def check_location(simulation_area, location: tuple) -> bool:
         """
         Check if a location is within the simulation area boundaries.
 
-        This prevents the robot from moving outside the valid table area.
+        This prevents the robot from moving outside the valid table area. Valid coordinates
+        run from 0 up to, but not including, the width and height of the area.
 
         Args:
             simulation_area (tuple[int, int]): The dimensions of the simulation area.
@@ -46,21 +57,22 @@ class LocationManager:
         Returns:
             bool: True if the location is valid, False otherwise.
         """
-        logger.debug(f'Checking location: {location}')
-        if location[0] < 0 or location[0] > simulation_area[0] or location[1] < 0 or location[1] > simulation_area[1]:
-            logger.warning(f'Location {location} is outside of simulation area {simulation_area}. Rejecting move.')
-            return False
-        return True
+        logger.debug('Checking location: %s', location)
+        x, y = location
+        width, height = simulation_area
+        if 0 <= x < width and 0 <= y < height:
+            return True
+        logger.warning(f'Location {location} is outside of simulation area {simulation_area}. Rejecting move.')
+        return False
 
-    @classmethod
-    def handle_rotation(cls, available_directions: list, rotation: str, current_direction: str = None) -> str:
+    @staticmethod
+    def handle_rotation(rotation: str, current_direction: str = None) -> str:
         """
         Handle the rotation of the robot when LEFT or RIGHT command is given.
 
         Rotates the robot 90 degrees clockwise (RIGHT) or counter-clockwise (LEFT).
 
         Args:
-            available_directions (list[str]): List of valid direction strings.
             rotation (str): The rotation direction ('LEFT' or 'RIGHT').
             current_direction (str, optional): The robot's current facing direction.
 
@@ -68,22 +80,23 @@ class LocationManager:
             str: The new direction after rotation.
 
         Raises:
-            Exception: If rotation is not 'LEFT' or 'RIGHT'.
+            Exception: If rotation is not 'LEFT' or 'RIGHT', or current_direction is not a valid direction.
         """
-        rotation_factor = 0
         match rotation:
-            case 'RIGHT': rotation_factor = 1
-            case 'LEFT': rotation_factor = -1
+            case 'RIGHT': rotations = LocationManager._RIGHT
+            case 'LEFT': rotations = LocationManager._LEFT
             case _: raise Exception(f'Invalid rotation direction. Must be LEFT or RIGHT. Received: {rotation}')
 
-        logger.debug(f'Requested rotation: {rotation}, Rotation factor set to: {rotation_factor}')
-        new_direction = available_directions[(available_directions.index(current_direction) + rotation_factor) % len(available_directions)]
-        logger.debug(f'Rotating right. current direction: {current_direction}, new direction: {new_direction}')
+        try:
+            new_direction = rotations[current_direction]
+        except KeyError:
+            raise Exception(f'Invalid current direction. Must be one of {LocationManager._DIRECTIONS}. Received: {current_direction}')
+        logger.debug('Rotating %s. current direction: %s, new direction: %s', rotation, current_direction, new_direction)
 
         return new_direction
 
-    @classmethod
-    def handle_move(cls, current_location: tuple[int, int], direction: str, distance: int = 1) -> tuple[int, int]:
+    @staticmethod
+    def handle_move(current_x: int, current_y: int, direction: str, distance: int = 1) -> tuple[int, int]:
         """
         Calculate the new position after moving in a specified direction.
 
@@ -91,28 +104,21 @@ class LocationManager:
         without actually updating the robot's position.
 
         Args:
-            current_location (tuple[int, int]): The current location as (x, y).
+            current_x (int): The current x-coordinate.
+            current_y (int): The current y-coordinate.
             direction (str): The direction to move (NORTH, EAST, SOUTH, WEST).
             distance (int, optional): The distance to move in units. Defaults to 1.
 
         Returns:
             tuple[int, int]: The new calculated position as (x, y).
         """
-        new_x, new_y = current_location
-        match direction:
-            case 'NORTH':
-                new_y += distance
-            case 'EAST':
-                new_x += distance
-            case 'SOUTH':
-                new_y -= distance
-            case 'WEST':
-                new_x -= distance
-            case _:
-                logger.error(f'Invalid direction: {direction}. Must be one of {cls.available_directions}')
-                return current_location
-        logger.debug(f'Moving in direction {direction} by {distance} units.')
-        return new_x, new_y
+        delta = LocationManager._DELTAS.get(direction)
+        if delta is None:
+            logger.error(f'Invalid direction: {direction}. Must be one of {LocationManager._DIRECTIONS}')
+            return current_x, current_y
+        dx, dy = delta
+        logger.debug('Moving in direction %s by %s units.', direction, distance)
+        return current_x + dx * distance, current_y + dy * distance
 
     def set_start_position(self, location: tuple[int, int, str] = None) -> bool:
         """
@@ -123,10 +129,16 @@ class LocationManager:
         Args:
             location (tuple[int, int, str], optional): The position as (x, y, direction).
                                                        Defaults to (0, 0, 'NORTH') if None.
+
+        Returns:
+            bool: True if the position was set, False if no location was given or the direction is invalid.
         """
         logger.debug('Setting robot start position.')
         if location is not None:
-            logger.debug(f'Setting robot start position to: {location}')
+            if location[2] not in self._VALID_DIRECTIONS:
+                logger.warning(f'Invalid direction: {location[2]}. Must be one of {self._DIRECTIONS}')
+                return False
+            logger.debug('Setting robot start position to: %s', location)
             self.location_x, self.location_y = location[0], location[1]
             self.location_facing = location[2]
             return True
@@ -141,8 +153,8 @@ class LocationManager:
             rotation (str): The rotation direction ('LEFT' or 'RIGHT').
         """
         try:
-            logger.debug(f'Updating robot rotation to {rotation}')
-            self.location_facing = self.handle_rotation(self.available_directions, rotation, self.location_facing)
+            logger.debug('Updating robot rotation to %s', rotation)
+            self.location_facing = self.handle_rotation(rotation, self.location_facing)
             return True
         except Exception as e:
             logger.error(f'Error updating robot rotation: {e}')
@@ -164,14 +176,14 @@ class LocationManager:
         Returns:
             tuple[int, int]: The robot's position after the move attempt as (x, y).
         """
-        new_x, new_y = self.handle_move((self.location_x, self.location_y), direction, distance)
-        if (new_x, new_y) == (self.location_x, self.location_y):
+        new_x, new_y = self.handle_move(self.location_x, self.location_y, direction, distance)
+        if new_x == self.location_x and new_y == self.location_y:
             logger.warning(f'Robot attempted to move {distance} units in direction {direction} but no change was made. Current location: ({self.location_x},{self.location_y})')
             return False
-        logger.debug(f'Robot attempted to move {distance} units in direction {direction}. New location: ({new_x},{new_y})')
+        logger.debug('Robot attempted to move %s units in direction %s. New location: (%s,%s)', distance, direction, new_x, new_y)
         if self.check_location(self.simulation_area, (new_x, new_y)):
             self.location_x, self.location_y = new_x, new_y
-            logger.debug(f'Robot moved {distance} units in direction {direction}. New location: ({self.location_x},{self.location_y})')
+            logger.debug('Robot moved %s units in direction %s. New location: (%s,%s)', distance, direction, self.location_x, self.location_y)
             return True
         else:
             logger.error(f'Robot attempted to move outside of simulation area ({self.simulation_area}). Current location: ({self.location_x},{self.location_y})')
@@ -188,5 +200,6 @@ class LocationManager:
         return f'({self.location_x},{self.location_y},{self.location_facing})'
 
     def is_placed(self):
-        logger.debug(f'Checking if robot is placed. location_x: {self.location_x}, location_y: {self.location_y}: {self.location_x and self.location_y is not None}')
-        return self.location_x is not None and self.location_y is not None
+        placed = self.location_x is not None and self.location_y is not None
+        logger.debug('Checking if robot is placed. location_x: %s, location_y: %s: %s', self.location_x, self.location_y, placed)
+        return placed
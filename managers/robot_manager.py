@@ -1,7 +1,5 @@
 import logging
 
-from config import config
-
 logger = logging.getLogger(__name__)
 
 from managers.location_manager import LocationManager
@@ -14,7 +12,8 @@ class RobotManager:
         location_manager (LocationManager): Manages the robot's location and movement logic.
     """
 
-    location_manager = None
+    __slots__ = ('location_manager',)
+
     def __init__(self, location_manager: LocationManager) -> None:
         """
         Initialise the RobotManager with a LocationManager instance.
@@ -47,11 +46,11 @@ class RobotManager:
         Returns:
             str: A message indicating the robot's new facing direction.
         """
-        logger.debug(f'Turning robot {rotation}. current facing: {self.location_manager.location_facing}')
+        logger.debug('Turning robot %s. current facing: %s', rotation, self.location_manager.location_facing)
         if not self.location_manager.is_placed():
             return 'Robot not placed. Please place robot before turning.'
         if self.location_manager.update_rotation(rotation):
-            logger.debug(f'Robot now facing: {self.location_manager.location_facing}')
+            logger.debug('Robot now facing: %s', self.location_manager.location_facing)
             return f'Robot is now facing {self.location_manager.location_facing}'
         return f'Failed to rotate to {rotation}. Robot is still facing {self.location_manager.location_facing}.'
 
@@ -67,7 +66,7 @@ class RobotManager:
         """
         if self.location_manager.set_start_position(location):
             return f'Robot placed successfully at {location}.'
-        return f'Robot placed at default location.'
+        return f'Failed to place robot at {location}. See logs for more details.'
 
     def report_robot_location(self) -> str:
         """
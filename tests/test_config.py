@@ -0,0 +1,48 @@
+import unittest
+
+from config.config import Config
+
+class TestConfig(unittest.TestCase):
+    """
+    Test cases for validating the config.
+    """
+
+    def test_check_config_valid(self):
+        """
+        A simulation area of (5, 5) is valid and returns no errors.
+        """
+        errors = Config.check_config((5, 5))
+
+        self.assertEqual(errors, [], f'Expected no errors, got {errors} instead.')
+
+    def test_check_config_none(self):
+        """
+        A missing simulation area returns one error.
+        """
+        errors = Config.check_config(None)
+
+        self.assertEqual(len(errors), 1, f'Expected 1 error, got {errors} instead.')
+
+    def test_check_config_not_tuple(self):
+        """
+        A simulation area that is not a tuple returns one error.
+        """
+        errors = Config.check_config([5, 5])
+
+        self.assertEqual(len(errors), 1, f'Expected 1 error, got {errors} instead.')
+
+    def test_check_config_non_positive(self):
+        """
+        A simulation area of (0, -1) returns an error for each dimension.
+        """
+        errors = Config.check_config((0, -1))
+
+        self.assertEqual(len(errors), 2, f'Expected 2 errors, got {errors} instead.')
+
+    def test_check_config_bool(self):
+        """
+        Booleans are not accepted as dimensions, even though bool is a subclass of int.
+        """
+        errors = Config.check_config((True, 5))
+
+        self.assertEqual(len(errors), 1, f'Expected 1 error, got {errors} instead.')
@@ -70,3 +70,34 @@ class TestRobotSimulator(unittest.TestCase):
         result = robot.report_robot_location()
 
         self.assertEqual(result, '(3,3,NORTH)', f'Expected "(3,3,NORTH)", got {result} instead."')
+
+    def test_case_move_off_table_is_ignored(self):
+        """
+        Test case D: PLACE 4,4,NORTH; MOVE; REPORT
+        Expected result: (4,4,NORTH), the top edge of a 5x5 table is y=4.
+        """
+        location_manager = LocationManager(self.simulation_area)
+        robot = RobotManager(location_manager)
+        # Place robot on the north east corner
+        robot.place_robot((4, 4, 'NORTH'))
+        # Attempt to move off the table
+        robot.move_robot()
+        # Report robot position
+        result = robot.report_robot_location()
+
+        self.assertEqual(result, '(4,4,NORTH)', f'Expected "(4,4,NORTH)", got {result} instead."')
+
+    def test_case_place_invalid_direction_is_rejected(self):
+        """
+        Test case E: PLACE 1,2,UP; REPORT
+        Expected result: placement fails and the robot stays unplaced, (None,None,None).
+        """
+        location_manager = LocationManager(self.simulation_area)
+        robot = RobotManager(location_manager)
+        # Attempt to place robot facing an invalid direction
+        message = robot.place_robot((1, 2, 'UP'))
+        # Report robot position
+        result = robot.report_robot_location()
+
+        self.assertEqual(message, "Failed to place robot at (1, 2, 'UP'). See logs for more details.")
+        self.assertEqual(result, '(None,None,None)', f'Expected "(None,None,None)", got {result} instead."')